@@ -11,17 +11,23 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
+import zipfile
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+from xml.sax.saxutils import escape
 
 try:
-    from openpyxl import Workbook
-except ImportError as exc:  # pragma: no cover - dependency check
-    raise SystemExit(
-        "Missing dependency: openpyxl\n\n"
-        "Install it with `python -m pip install openpyxl` (ideally inside your virtualenv) "
-        "and rerun this command."
-    ) from exc
+    import json_stream
+    from json_stream.base import StreamingJSONObject
+except ImportError:  # pragma: no cover - optional dependency
+    json_stream = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 
 COLUMNS: List[str] = [
@@ -36,40 +42,214 @@ COLUMNS: List[str] = [
     "Batch",
     "Location",
 ]
+# Everything after the leading "YC Link" column comes straight from the fields
+_DATA_COLS = tuple(c for c in COLUMNS if c != "YC Link")
+
+
+def load_checkpoint(path: Path) -> Iterator[Tuple[Any, Any]]:
+    """Yield (YC link, fields) pairs from the checkpoint one entry at a time.
 
+    Rows still sitting in the scraper's sibling `.ckpt.jsonl` log, from a run
+    that was killed before it could compact it, are replayed on top, so those
+    runs can be exported too (even when the JSON file was never written).
+    """
+    log = load_checkpoint_log(path.with_suffix(".jsonl"))
+    if path.exists() or not log:
+        for k, v in _iter_checkpoint_json(path):
+            if k not in log:
+                yield k, v
+    yield from log.items()
 
-def load_checkpoint(path: Path) -> Dict[str, Dict[str, Any]]:
+
+def load_checkpoint_log(path: Path) -> Dict[str, Any]:
+    """Read the scraper's JSONL checkpoint log; later lines win."""
+    entries: Dict[str, Any] = {}
+    if not path.exists():
+        return entries
+    loads = orjson.loads if orjson is not None else json.loads
+    try:
+        with path.open("rb") as f:
+            for line in f:
+                try:
+                    entry = loads(line)
+                except ValueError:
+                    # most likely a line cut short by a killed run
+                    continue
+                if isinstance(entry, dict):
+                    entries.update(entry)
+    except OSError as exc:
+        raise SystemExit(f"Failed to read checkpoint log {path}: {exc}") from exc
+    return entries
+
+
+def _iter_checkpoint_json(path: Path) -> Iterator[Tuple[Any, Any]]:
+    """Yield the entries of the JSON checkpoint file.
+
+    With `json_stream` installed the file is parsed incrementally, so only the
+    current entry is ever held in memory; otherwise the whole file is parsed at
+    once with `orjson` (or `json` if that is missing too).
+    """
     try:
         with path.open("r", encoding="utf-8") as f:
-            raw = json.load(f)
-            if isinstance(raw, dict):
-                return {str(k): dict(v) for k, v in raw.items() if isinstance(v, dict)}
+            if json_stream is not None:
+                raw = json_stream.load(f)
+                is_object = isinstance(raw, StreamingJSONObject)
+            else:
+                raw = orjson.loads(f.read()) if orjson is not None else json.load(f)
+                is_object = isinstance(raw, dict)
+            if not is_object:
+                raise SystemExit(
+                    f"Unexpected checkpoint structure in {path}. Expected a JSON object."
+                )
+            if json_stream is None:
+                yield from raw.items()
+                return
+            for k, v in raw.items():
+                yield k, json_stream.to_standard_types(v)
+    except SystemExit:
+        raise
     except Exception as exc:
         raise SystemExit(f"Failed to read checkpoint {path}: {exc}") from exc
-    raise SystemExit(
-        f"Unexpected checkpoint structure in {path}. Expected a JSON object."
-    )
 
 
-def iter_rows(data: Dict[str, Dict[str, Any]]) -> Iterable[List[Any]]:
-    for url, fields in data.items():
-        row = []
-        for column in COLUMNS:
-            if column == "YC Link":
-                row.append(url)
-            else:
-                row.append(fields.get(column))
-        yield row
+def iter_rows(data: Iterable[Tuple[Any, Any]]) -> Iterable[Tuple[Any, ...]]:
+    for url, fields in data:
+        if not isinstance(fields, dict):
+            continue  # not a scraped row
+        if not isinstance(url, str):
+            url = str(url)
+        yield (url, *map(fields.get, _DATA_COLS))
+
+
+# ------------------------------
+# Minimal xlsx writer
+# ------------------------------
+# The export is a single flat, unstyled sheet, so the workbook is emitted as raw
+# SpreadsheetML instead of going through openpyxl's per-cell objects.
+
+SHEET_TITLE = "YC Companies"
+# The deflated sheet arrives in small chunks; buffer them into fewer writes.
+WRITE_BUFFER_SIZE = 1 << 20
+
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    "</Types>"
+)
+
+_ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+
+_WORKBOOK_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{title}" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+
+_WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    "</Relationships>"
+)
+
+_STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    "</styleSheet>"
+)
+
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    "<sheetData>"
+)
+_SHEET_TAIL = "</sheetData></worksheet>"
+
+# Control characters that are not allowed anywhere in an XML 1.0 document.
+_ILLEGAL_XML_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _column_letter(index: int) -> str:
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+
+def _cell_xml(ref: str, value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}"><v>{value!r}</v></c>'
+    text = escape(_ILLEGAL_XML_CHARS_RE.sub("", str(value)))
+    return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _write_xlsx(
+    path: Path, columns: Sequence[str], rows: Iterable[Sequence[Any]]
+) -> int:
+    """Write a single-sheet workbook, streaming rows into the sheet part.
+
+    Returns the number of data rows written (excluding the header).
+    """
+    letters = [_column_letter(i) for i in range(len(columns))]
+    # Rows may come from a lazily parsed checkpoint, so write to a temp file and
+    # only replace the destination once every row made it into the sheet.
+    tmp = path.with_suffix(".tmp")
+    try:
+        with open(tmp, "wb", buffering=WRITE_BUFFER_SIZE) as raw, zipfile.ZipFile(
+            raw, "w", compression=zipfile.ZIP_DEFLATED
+        ) as zf:
+            zf.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+            zf.writestr("_rels/.rels", _ROOT_RELS_XML)
+            zf.writestr(
+                "xl/workbook.xml",
+                _WORKBOOK_XML.format(title=escape(SHEET_TITLE, {'"': "&quot;"})),
+            )
+            zf.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS_XML)
+            zf.writestr("xl/styles.xml", _STYLES_XML)
+            with zf.open("xl/worksheets/sheet1.xml", "w") as sheet:
+                sheet.write(_SHEET_HEAD.encode("utf-8"))
+                for r, row in enumerate(chain([columns], rows), start=1):
+                    cells = "".join(
+                        _cell_xml(f"{letter}{r}", value)
+                        for letter, value in zip(letters, row)
+                    )
+                    sheet.write(f'<row r="{r}">{cells}</row>'.encode("utf-8"))
+                sheet.write(_SHEET_TAIL.encode("utf-8"))
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    tmp.replace(path)
+    return r - 1
 
 
-def export_to_excel(data: Dict[str, Dict[str, Any]], output_path: Path) -> None:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "YC Companies"
-    ws.append(COLUMNS)
-    for row in iter_rows(data):
-        ws.append(row)
-    wb.save(output_path)
+def export_to_excel(data: Iterable[Tuple[Any, Any]], output_path: Path) -> int:
+    return _write_xlsx(output_path, COLUMNS, iter_rows(data))
 
 
 def parse_args() -> argparse.Namespace:
@@ -93,9 +273,8 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
-    data = load_checkpoint(args.input)
-    export_to_excel(data, args.output)
-    print(f"Wrote {len(data)} rows to {args.output}")
+    count = export_to_excel(load_checkpoint(args.input), args.output)
+    print(f"Wrote {count} rows to {args.output}")
 
 
 if __name__ == "__main__":
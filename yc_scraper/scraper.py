@@ -11,42 +11,179 @@ polite rate limiting, retries with backoff, and resumable checkpoints.
 
 import asyncio
 import csv
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 import json
+import multiprocessing
+import os
 import random
 import re
+import signal
 import argparse
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import httpx
-from bs4 import BeautifulSoup
+
+try:
+    import h2  # noqa: F401 - presence enables HTTP/2 in httpx
+except ImportError:  # pragma: no cover - optional speedup
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup
+    uvloop = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional speedup
+    LexborHTMLParser = None
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:  # pragma: no cover - optional fallback
+    BeautifulSoup = None
+
+try:
+    import lxml  # noqa: F401 - only used as a BeautifulSoup tree builder
+except ImportError:  # pragma: no cover - optional speedup
+    BS4_PARSER = "html.parser"
+else:
+    BS4_PARSER = "lxml"
+
+_NEXT_DATA_RE = re.compile(
+    rb"<script[^>]*\bid=[\"']?__NEXT_DATA__[\"']?[^>]*>(.*?)</script>", re.S | re.I
+)
+# Fallback fields read from right-rail labels, with the label spellings to try
+_FIELD_LABELS: Dict[str, List[str]] = {
+    "primary_partner": ["Primary Partner"],
+    "status": ["Status"],
+    "location": ["Location"],
+    "founded_year": ["Founded"],
+    "team_size": ["Team Size", "Team size"],
+    "batch": ["Batch"],
+}
+_INT_FIELDS = {"founded_year", "team_size"}
+# Everything parse_html_fallback can produce
+FALLBACK_FIELDS = (*_FIELD_LABELS, "website", "founders", "founders_linkedin")
+
+# Visible label text like "Primary Partner:" on the right rail
+_LABEL_RES = {
+    label: re.compile(rf"^\s*{re.escape(label)}\s*:?$", re.I)
+    for labels in _FIELD_LABELS.values()
+    for label in labels
+}
+_FOUNDER_RE = re.compile(r"Founder", re.I)
+_DIGITS_RE = re.compile(r"\d+")
+# Homepage candidate: an absolute href that is not YC-internal
+_WEBSITE_RE = re.compile(r"http(?!.*ycombinator\.com)", re.S)
+
+# Output files run to several MB; a larger buffer means far fewer write calls.
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Below this many pages to scrape, starting parse processes costs more than it
+# saves and pages are parsed in threads instead.
+PROCESS_POOL_MIN_PAGES = 100
 
 # ------------------------------
 # Helpers
 # ------------------------------
 
 
-def deep_find_all_keys(obj: Any, key: str) -> List[Any]:
-    """Recursively find all values for a given key in a nested dict/list."""
-    found = []
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if k == key:
-                found.append(v)
-            found.extend(deep_find_all_keys(v, key))
-    elif isinstance(obj, list):
-        for item in obj:
-            found.extend(deep_find_all_keys(item, key))
-    return found
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson when available, else the stdlib parser."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes (non-ASCII kept as-is)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def json_dumps_line(obj: Any) -> bytes:
+    """Serialize to one compact line of UTF-8 JSON, newline-terminated."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+    line = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return line.encode("utf-8") + b"\n"
+
+
+# Placeholder key for list elements, which never matches a real dict key.
+_LIST_ITEM = object()
+
+
+def deep_iter_items(obj: Any) -> Iterator[Tuple[Any, Any]]:
+    """Yield every (key, value) pair of the dicts nested in obj, depth first.
+
+    Each value is yielded before its own children, so the order matches a plain
+    recursive walk. Children are pushed onto a flat deque in reverse so they pop
+    off in document order, and no recursion is involved. Containers are
+    detected with exact `type()` checks, which is all JSON-decoded data needs.
+    """
+    stack: Deque[Tuple[Any, Any]] = deque()
+    if type(obj) is dict:
+        stack.extend(reversed(obj.items()))
+    elif type(obj) is list:
+        stack.extend([(_LIST_ITEM, item) for item in reversed(obj)])
+    pop = stack.pop
+    push = stack.extend
+    while stack:
+        k, v = pop()
+        if k is not _LIST_ITEM:
+            yield k, v
+        t = type(v)
+        if t is dict:
+            push(reversed(v.items()))
+        elif t is list:
+            push([(_LIST_ITEM, item) for item in reversed(v)])
+
+
+def deep_find_all_keys(obj: Any, key: str) -> Iterator[Any]:
+    """Lazily yield all values for a given key in a nested dict/list."""
+    return (v for k, v in deep_iter_items(obj) if k == key)
 
 
 def deep_find_first(obj: Any, keys: List[str]) -> Optional[Any]:
-    """Return the first value found for any of the keys."""
-    for key in keys:
-        vals = deep_find_all_keys(obj, key)
-        if vals:
-            return vals[0]
-    return None
+    """Return the first value found for any of the keys.
+
+    Earlier keys take priority over later ones regardless of where they sit in
+    the tree. The tree is walked once, stopping early if keys[0] turns up.
+    """
+    rank: Dict[str, int] = {}
+    for i, key in enumerate(keys):
+        rank.setdefault(key, i)
+    best_rank = len(keys)
+    best = None
+    for k, v in deep_iter_items(obj):
+        r = rank.get(k)
+        if r is not None and r < best_rank:
+            best_rank, best = r, v
+            if r == 0:
+                break
+    return best
 
 
 def norm_int(x: Any) -> Optional[int]:
@@ -56,25 +193,122 @@ def norm_int(x: Any) -> Optional[int]:
         return int(str(x).strip())
     except Exception:
         # Try to extract digits
-        m = re.search(r"\d+", str(x))
+        m = _DIGITS_RE.search(str(x))
         return int(m.group()) if m else None
 
 
 def as_semicolon(values: List[str]) -> str:
-    cleaned = [v.strip() for v in values if v and str(v).strip()]
-    return "; ".join(dict.fromkeys(cleaned))  # preserve order, dedupe
+    # single pass: strip, drop blanks, dedupe while preserving order
+    seen = set()
+    out = []
+    for v in values:
+        if not v:
+            continue
+        s = v.strip() if isinstance(v, str) else str(v).strip()
+        if s and s not in seen:
+            seen.add(s)
+            out.append(s)
+    return "; ".join(out)
+
+
+def _scan_hrefs(
+    hrefs: Iterable[str], wanted: Set[str]
+) -> Tuple[Optional[str], List[str]]:
+    """One pass over the page's hrefs for the website and LinkedIn links.
+
+    The website is the first homepage-looking href that isn't YC-internal;
+    LinkedIn links (founder icons/links) are collected in page order.
+    """
+    want_website = "website" in wanted
+    want_linkedin = "founders_linkedin" in wanted
+    website: Optional[str] = None
+    linkedin_urls: List[str] = []
+    for href in hrefs:
+        if want_website and website is None and _WEBSITE_RE.match(href):
+            website = href
+            if not want_linkedin:
+                break
+        if want_linkedin and "linkedin.com" in href:
+            linkedin_urls.append(href)
+    return website, linkedin_urls
+
+
+def parse_html_fallback(
+    html: bytes, fields: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
+    """Loose HTML parser when __NEXT_DATA__ is not usable.
 
+    `fields` restricts the work to a subset of FALLBACK_FIELDS (default: all).
+    """
+    wanted = set(FALLBACK_FIELDS if fields is None else fields)
+    if LexborHTMLParser is not None:
+        return _parse_html_fallback_lexbor(html, wanted)
+    return _parse_html_fallback_bs4(html, wanted)
 
-def parse_html_fallback(html: str) -> Dict[str, Any]:
-    """Loose HTML parser when __NEXT_DATA__ is not usable."""
-    soup = BeautifulSoup(html, "html.parser")
+
+def _parse_html_fallback_lexbor(html: bytes, wanted: Set[str]) -> Dict[str, Any]:
+    """selectolax (lexbor) port of `_parse_html_fallback_bs4`."""
+    tree = LexborHTMLParser(html)
+    out: Dict[str, Any] = {}
+
+    # Flatten the document once; traverse() yields nodes in document order, which
+    # is what bs4's string searches and find_next() walk as well.
+    nodes: List[Any] = []
+    if tree.root and ("founders" in wanted or not wanted.isdisjoint(_FIELD_LABELS)):
+        nodes = list(tree.root.traverse(include_text=True))
+
+    def get_value_by_label(label_texts: List[str]) -> Optional[str]:
+        for label in label_texts:
+            pattern = _LABEL_RES[label]
+            for i, node in enumerate(nodes):
+                if node.tag == "-text" and pattern.search(node.text(deep=False)):
+                    # first element after the label
+                    for j in range(i + 1, len(nodes)):
+                        sib = nodes[j]
+                        if sib.tag not in ("-text", "-comment"):
+                            return sib.text(strip=True)
+                    break
+        return None
+
+    for field, labels in _FIELD_LABELS.items():
+        if field in wanted:
+            value = get_value_by_label(labels)
+            out[field] = norm_int(value) if field in _INT_FIELDS else value
+
+    if "website" in wanted or "founders_linkedin" in wanted:
+        hrefs = (a.attributes.get("href") or "" for a in tree.css("a[href]"))
+        website, linkedin_urls = _scan_hrefs(hrefs, wanted)
+        if "website" in wanted and website is not None:
+            out["website"] = website
+        if "founders_linkedin" in wanted:
+            out["founders_linkedin"] = linkedin_urls or None
+
+    if "founders" in wanted:
+        founders: List[str] = []
+        # Names often appear next to "Founder" strings
+        for node in nodes:
+            if node.tag != "-text" or not _FOUNDER_RE.search(node.text(deep=False)):
+                continue
+            parent = node.parent
+            for sib in [parent.prev, parent.next]:
+                if sib is not None and sib.tag != "-comment":
+                    txt = sib.text(separator=" ", strip=True)
+                    if txt and len(txt.split()) <= 5 and not _FOUNDER_RE.search(txt):
+                        founders.append(txt)
+        out["founders"] = founders or None
+    return out
+
+
+def _parse_html_fallback_bs4(html: bytes, wanted: Set[str]) -> Dict[str, Any]:
+    """BeautifulSoup version of the fallback, used when selectolax is missing."""
+    soup = BeautifulSoup(html.decode("utf-8", errors="replace"), BS4_PARSER)
     out: Dict[str, Any] = {}
 
     # Try to parse right-rail label-value pairs (dt/dd or text-based)
     def get_value_by_label(label_texts: List[str]) -> Optional[str]:
         for label in label_texts:
             # Match visible text like "Primary Partner:"
-            el = soup.find(string=re.compile(rf"^\s*{re.escape(label)}\s*:?$", re.I))
+            el = soup.find(string=_LABEL_RES[label])
             if el and el.parent:
                 # sibling value
                 sib = el.find_next()
@@ -82,58 +316,45 @@ def parse_html_fallback(html: str) -> Dict[str, Any]:
                     return sib.get_text(strip=True)
         return None
 
-    out["primary_partner"] = get_value_by_label(["Primary Partner"])
-    out["status"] = get_value_by_label(["Status"])
-    out["location"] = get_value_by_label(["Location"])
-    founded = get_value_by_label(["Founded"])
-    out["founded_year"] = norm_int(founded)
-    team_size = get_value_by_label(["Team Size", "Team size"])
-    out["team_size"] = norm_int(team_size)
-    out["batch"] = get_value_by_label(["Batch"])
-
-    # Website link (look for external link icon or direct anchor with the domain)
-    # Prefer obvious homepage-looking hrefs that aren't YC-internal.
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if href.startswith("http") and "ycombinator.com" not in href:
-            out["website"] = href
-            break
-
-    # Founders: sometimes listed on the page; heuristics
-    founders: List[str] = []
-    linkedin_urls: List[str] = []
-    # Look for LinkedIn icons/links
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if "linkedin.com" in href:
-            linkedin_urls.append(href)
-    # Names often appear near "Founder" strings; grab nearby strong/em tags
-    for tag in soup.find_all(string=re.compile(r"Founder", re.I)):
-        # grab previous/next siblings for names
-        for sib in [tag.parent.previous_sibling, tag.parent.next_sibling]:
-            if hasattr(sib, "get_text"):
-                txt = sib.get_text(" ", strip=True)
-                if (
-                    txt
-                    and len(txt.split()) <= 5
-                    and not re.search(r"Founder", txt, re.I)
-                ):
-                    founders.append(txt)
-    out["founders"] = founders or None
-    out["founders_linkedin"] = linkedin_urls or None
+    for field, labels in _FIELD_LABELS.items():
+        if field in wanted:
+            value = get_value_by_label(labels)
+            out[field] = norm_int(value) if field in _INT_FIELDS else value
+
+    if "website" in wanted or "founders_linkedin" in wanted:
+        hrefs = (a["href"] for a in soup.find_all("a", href=True))
+        website, linkedin_urls = _scan_hrefs(hrefs, wanted)
+        if "website" in wanted and website is not None:
+            out["website"] = website
+        if "founders_linkedin" in wanted:
+            out["founders_linkedin"] = linkedin_urls or None
+
+    if "founders" in wanted:
+        # Founders: sometimes listed on the page; heuristics
+        founders: List[str] = []
+        # Names often appear near "Founder" strings; grab nearby strong/em tags
+        for tag in soup.find_all(string=_FOUNDER_RE):
+            # grab previous/next siblings for names
+            for sib in [tag.parent.previous_sibling, tag.parent.next_sibling]:
+                if hasattr(sib, "get_text"):
+                    txt = sib.get_text(" ", strip=True)
+                    if txt and len(txt.split()) <= 5 and not _FOUNDER_RE.search(txt):
+                        founders.append(txt)
+        out["founders"] = founders or None
     return out
 
 
-def extract_from_next_data(html: str) -> Dict[str, Any]:
-    soup = BeautifulSoup(html, "html.parser")
+def extract_from_next_data(html: bytes) -> Dict[str, Any]:
     out: Dict[str, Any] = {}
 
-    script = soup.find("script", id="__NEXT_DATA__")
-    if not script or not script.string:
+    # Only the one <script> body is needed, so grab it from the raw markup
+    # instead of building a DOM for the whole page.
+    m = _NEXT_DATA_RE.search(html)
+    if not m or not m.group(1).strip():
         return out
 
     try:
-        data = json.loads(script.string)
+        data = json_loads(m.group(1))
     except Exception:
         return out
 
@@ -222,45 +443,89 @@ def extract_from_next_data(html: str) -> Dict[str, Any]:
     return out
 
 
+def _is_blank(v: Any) -> bool:
+    return v in (None, "", [], {})
+
+
 def merge_preferring_left(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
     out = dict(a)
     for k, v in b.items():
-        if k not in out or out[k] in (None, "", [], {}):
+        if k not in out or _is_blank(out[k]):
             out[k] = v
     return out
 
 
+# Fallback fields that can reach the output; the fallback's "founders" never does.
+_MERGED_FALLBACK_FIELDS = tuple(f for f in FALLBACK_FIELDS if f != "founders")
+
+
+def _parse_page(html: bytes) -> Dict[str, Any]:
+    """Parse a page: first try Next.js data, then fill gaps from the HTML."""
+    out = extract_from_next_data(html)
+    # Only run the slower HTML fallback for fields __NEXT_DATA__ left blank
+    missing = [f for f in _MERGED_FALLBACK_FIELDS if _is_blank(out.get(f))]
+    if not missing:
+        return out
+    return merge_preferring_left(out, parse_html_fallback(html, missing))
+
+
 # ------------------------------
 # Scraper
 # ------------------------------
 
 
-async def fetch(client: httpx.AsyncClient, url: str) -> Optional[str]:
+class RateLimiter:
+    """Global request pacing shared by all workers.
+
+    Hands out evenly spaced start slots so that at most `rpm` requests begin per
+    minute, however many workers are running.
+    """
+
+    def __init__(self, rpm: int):
+        self._interval = 60.0 / max(1, rpm)
+        self._next_slot = 0.0
+
+    async def __aenter__(self) -> "RateLimiter":
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+async def fetch(client: httpx.AsyncClient, url: str) -> Optional[bytes]:
+    """Return the raw response body; parsers work on bytes to skip a decode."""
     try:
         r = await client.get(url, follow_redirects=True, timeout=30.0)
         if r.status_code == 200:
-            return r.text
+            return r.content
         return None
     except Exception:
         return None
 
 
 async def scrape_one(
-    url: str, client: httpx.AsyncClient, rpm: int, retries: int = 4
+    url: str,
+    client: httpx.AsyncClient,
+    limiter: RateLimiter,
+    parse_pool: Optional[Executor] = None,
+    retries: int = 4,
 ) -> Dict[str, Any]:
-    # rate limit: rpm requests per minute -> delay between requests ~ 60/rpm
-    delay = 60.0 / max(1, rpm)
     attempt = 0
     while True:
         attempt += 1
-        html = await fetch(client, url)
+        async with limiter:
+            html = await fetch(client, url)
         if html:
-            # Parse: first try Next.js data, then HTML fallback
-            out = extract_from_next_data(html)
-            if not out:
-                out = {}
-            fb = parse_html_fallback(html)
-            out = merge_preferring_left(out, fb)
+            # Parsing is CPU-bound; keep it off the loop so other fetches proceed.
+            # Without a process pool this runs on the default thread executor.
+            out = await asyncio.get_running_loop().run_in_executor(
+                parse_pool, _parse_page, html
+            )
 
             # Normalize lists to strings
             if "active_founders" in out and isinstance(out["active_founders"], list):
@@ -288,8 +553,8 @@ async def scrape_one(
         if attempt > retries:
             return {"YC Link": url}
 
-        # backoff with jitter
-        sleep_s = delay * (2 ** (attempt - 1)) + random.uniform(0, 0.5)
+        # exponential backoff with jitter; retries still go through the limiter
+        sleep_s = 2 ** (attempt - 1) + random.uniform(0, 0.5)
         await asyncio.sleep(sleep_s)
 
 
@@ -297,11 +562,14 @@ async def worker(
     name: int,
     queue: asyncio.Queue,
     client: httpx.AsyncClient,
-    rpm: int,
+    limiter: RateLimiter,
+    parse_pool: Optional[Executor],
     results: Dict[str, Dict[str, Any]],
+    rows: List[Optional[Dict[str, Any]]],
+    log_path: Path,
+    log_writer: Executor,
     total: int,
 ):
-    delay = 60.0 / max(1, rpm)
     while True:
         item = await queue.get()
         if item is None:
@@ -314,8 +582,12 @@ async def worker(
                 f"[Worker {name}] Starting {ordinal}/{total}: {url}",
                 flush=True,
             )
-            data = await scrape_one(url, client, rpm)
-            results[url] = data
+            data = await scrape_one(url, client, limiter, parse_pool)
+            rows[idx] = data
+            results[url] = data  # for the checkpoint
+            await asyncio.get_running_loop().run_in_executor(
+                log_writer, append_checkpoint_log, log_path, url, data
+            )
             if any(k != "YC Link" and data.get(k) for k in data):
                 print(
                     f"[Worker {name}] Success {ordinal}/{total}: {url}",
@@ -332,8 +604,6 @@ async def worker(
                 flush=True,
             )
         finally:
-            # polite pacing between individual requests by this worker
-            await asyncio.sleep(delay + random.uniform(0, 0.25))
             queue.task_done()
 
 
@@ -345,7 +615,7 @@ def load_links(path: Path) -> List[str]:
         return [row["YC Link"] for row in reader if row.get("YC Link")]
 
 
-def write_csv(path: Path, rows: List[Dict[str, Any]]):
+def write_csv(path: Path, rows: Iterable[Dict[str, Any]]):
     # Fixed column order to match the user's sheet
     fieldnames = [
         "YC Link",
@@ -359,30 +629,54 @@ def write_csv(path: Path, rows: List[Dict[str, Any]]):
         "Batch",
         "Location",
     ]
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in rows:
-            writer.writerow({k: r.get(k) for k in fieldnames})
+    with path.open("w", buffering=WRITE_BUFFER_SIZE, newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows([r.get(k) for k in fieldnames] for r in rows)
 
 
 def load_checkpoint(path: Path) -> Dict[str, Dict[str, Any]]:
     if not path.exists():
         return {}
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        with path.open("rb") as f:
+            return json_loads(f.read())
     except Exception:
         return {}
 
 
 def save_checkpoint(path: Path, data: Dict[str, Dict[str, Any]]):
     tmp = path.with_suffix(".tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with tmp.open("wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(json_dumps_bytes(data))
     tmp.replace(path)
 
 
+def append_checkpoint_log(path: Path, url: str, data: Dict[str, Any]):
+    """Append one scraped row to the JSONL checkpoint log."""
+    # Unbuffered so each line lands in a single write() and lines from
+    # concurrent appends cannot interleave.
+    with open(path, "ab", buffering=0) as f:
+        f.write(json_dumps_line({url: data}))
+
+
+def load_checkpoint_log(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Replay the JSONL checkpoint log; later lines win over earlier ones."""
+    results: Dict[str, Dict[str, Any]] = {}
+    if not path.exists():
+        return results
+    with path.open("rb") as f:
+        for line in f:
+            try:
+                entry = json_loads(line)
+            except Exception:
+                # most likely a line cut short by an interrupted run
+                continue
+            if isinstance(entry, dict):
+                results.update(entry)
+    return results
+
+
 async def main():
     parser = argparse.ArgumentParser(description="Scrape YC company pages into CSV.")
     parser.add_argument(
@@ -401,14 +695,28 @@ async def main():
         default=120,
         help="Max requests per minute per process (default 120)",
     )
+    parser.add_argument(
+        "--parse-processes",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes used to parse pages (default: CPU count; 1 parses in threads)",
+    )
     parser.add_argument(
         "--resume", action="store_true", help="Resume from checkpoint if present"
     )
     args = parser.parse_args()
 
+    if LexborHTMLParser is None and BeautifulSoup is None:
+        raise SystemExit(
+            "Missing dependency: install selectolax (preferred) or beautifulsoup4 "
+            "with `python -m pip install selectolax` and rerun this command."
+        )
+
     input_path = Path(args.input)
     output_path = Path(args.output)
     ckpt_path = output_path.with_suffix(output_path.suffix + ".ckpt.json")
+    # Rows are appended here as they finish and folded into ckpt_path at the end
+    log_path = ckpt_path.with_suffix(".jsonl")
 
     links = load_links(input_path)
     print(f"Loaded {len(links)} links.")
@@ -416,8 +724,11 @@ async def main():
     results: Dict[str, Dict[str, Any]] = {}
     if args.resume:
         results = load_checkpoint(ckpt_path)
+        results.update(load_checkpoint_log(log_path))
         if results:
             print(f"Resuming: {len(results)} rows already scraped.")
+    else:
+        log_path.unlink(missing_ok=True)
 
     headers = {
         "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
@@ -432,48 +743,137 @@ async def main():
         max_keepalive_connections=args.concurrency * 2,
     )
 
-    queue: asyncio.Queue = asyncio.Queue()
+    # Default executor for thread-based page parsing; each worker has at most
+    # one page in flight.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=max(1, args.concurrency))
+    )
+    # Checkpoint appends get their own thread so they can be drained before
+    # the final compaction, even when the workers were cancelled mid-append.
+    log_writer = ThreadPoolExecutor(max_workers=1)
+
     total = len(links)
+    done = results.keys() & set(links)
+    # Output rows in input order: resumed rows are filled in here, the rest by
+    # the workers as they finish.
+    rows: List[Optional[Dict[str, Any]]] = [None] * total
+    pending = []
     for idx, url in enumerate(links):
-        if url in results:
-            continue
-        queue.put_nowait((idx, url))
-
-    async with httpx.AsyncClient(
-        headers=headers, timeout=timeout, limits=limits
-    ) as client:
-        workers = [
-            asyncio.create_task(worker(i, queue, client, args.rpm, results, total))
-            for i in range(args.concurrency)
-        ]
-
-        # Periodic checkpointing
-        async def checkpoint_loop():
-            while any(not w.done() for w in workers):
-                await asyncio.sleep(10)
-                if results:
-                    save_checkpoint(ckpt_path, results)
-
-        cp_task = asyncio.create_task(checkpoint_loop())
-
-        await queue.join()
-        for _ in workers:
-            queue.put_nowait(None)
-        await asyncio.gather(*workers)
-        cp_task.cancel()
-        try:
-            await cp_task
-        except asyncio.CancelledError:
-            pass
+        if url in done:
+            rows[idx] = results[url]
+        else:
+            pending.append((idx, url))
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in pending:
+        queue.put_nowait(item)
+
+    # Separate processes let pages parse in parallel despite the GIL. "spawn"
+    # avoids forking a process that already has helper threads running. The
+    # children ignore Ctrl-C (sent to the whole process group); the parent
+    # shuts them down.
+    parse_pool: Optional[ProcessPoolExecutor] = None
+    if args.parse_processes > 1 and len(pending) >= PROCESS_POOL_MIN_PAGES:
+        parse_pool = ProcessPoolExecutor(
+            max_workers=args.parse_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=signal.signal,
+            initargs=(signal.SIGINT, signal.SIG_IGN),
+        )
+
+    # First Ctrl-C stops the scrape; repeats, and any Ctrl-C once the scrape is
+    # over, are ignored so the CSV write and checkpoint compaction below are
+    # not cut short.
+    main_task = asyncio.current_task()
+    interrupted = False
+    scraping = True
+
+    def on_sigint() -> None:
+        nonlocal interrupted
+        if scraping and not interrupted:
+            interrupted = True
+            print("Interrupted, saving checkpoint...", flush=True)
+            main_task.cancel()
+
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGINT, on_sigint)
+    except NotImplementedError:  # pragma: no cover - e.g. Windows event loops
+        pass
 
-    # Merge order according to input
-    rows = [results.get(url, {"YC Link": url}) for url in links]
-    write_csv(output_path, rows)
-    save_checkpoint(ckpt_path, results)  # final
+    completed = saved = False
+    try:
+        # HTTP/2 multiplexes concurrent requests over one TLS connection to the host.
+        async with httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE, headers=headers, timeout=timeout, limits=limits
+        ) as client:
+            limiter = RateLimiter(args.rpm)
+            workers = [
+                asyncio.create_task(
+                    worker(
+                        i,
+                        queue,
+                        client,
+                        limiter,
+                        parse_pool,
+                        results,
+                        rows,
+                        log_path,
+                        log_writer,
+                        total,
+                    )
+                )
+                for i in range(args.concurrency)
+            ]
+
+            try:
+                await queue.join()
+                for _ in workers:
+                    queue.put_nowait(None)
+                await asyncio.gather(*workers)
+            finally:
+                # On interrupt, stop the workers so results is settled before
+                # it gets compacted below.
+                for w in workers:
+                    w.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                if parse_pool is not None:
+                    parse_pool.shutdown(cancel_futures=True)
+
+        scraping = False
+        # Rows whose worker errored out are still written, with just the link
+        write_csv(
+            output_path,
+            [row or {"YC Link": url} for row, url in zip(rows, links)],
+        )
+        completed = True
+    except asyncio.CancelledError:
+        if not interrupted:
+            raise
+    finally:
+        scraping = False
+        # Compact into the JSON checkpoint on every shutdown, Ctrl-C included,
+        # so a partial run can still be exported; then drop the log.
+        await asyncio.to_thread(log_writer.shutdown)
+        if completed or results:
+            await asyncio.to_thread(save_checkpoint, ckpt_path, results)
+            log_path.unlink(missing_ok=True)
+            saved = True
+
+    if not completed:
+        if saved:
+            print(f"Checkpoint at {ckpt_path}; rerun with --resume to continue.")
+        raise SystemExit(130)
 
     print(f"Done. Wrote {len(rows)} rows to {output_path}")
     print(f"Checkpoint at {ckpt_path} (you can delete it if not needed).")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # faster socket handling for the many concurrent HTTPS requests
+    if uvloop is not None and hasattr(uvloop, "run"):
+        uvloop.run(main())
+    elif uvloop is not None:  # uvloop < 0.18 has no run()
+        uvloop.install()
+        asyncio.run(main())
+    else:
+        asyncio.run(main())